@@ -9,13 +9,12 @@ mount point, absolute path, or relative path.
 
 Attributes:
     path (str): The normalized path string.
-    sep (str): The path separator. Defaults to the os separator.
-    pardir (str): The parent directory indicator. Defaults to the os default (usually '..').
-    altsep (str): The alternative path separator. Defaults to the os alternative separator.
-    extsep (str): The extension separator. Defaults to '.'.
+    sep (str): Class-level constant for the path separator, taken from the os module.
+    pardir (str): Class-level constant for the parent directory indicator (usually '..').
+    altsep (str): Class-level constant for the alternative path separator.
+    extsep (str): Class-level constant for the extension separator (usually '.').
 
-This module relies on the `os` module for interacting with the underlying operating system, and 
-the `dataclasses` module for defining the `WinPath` class as a data class.
+This module relies on the `os` module for interacting with the underlying operating system.
 
 Example usage:
 
@@ -27,11 +26,89 @@ Example usage:
     print(path.ext)
 """
 import os
-from dataclasses import dataclass, field
-from typing import Self
+import re
+import stat as statmod
+import sys
+from typing import Iterable, Self
+
+# os.path callables bound once at module scope; saves two attribute lookups per
+# call in hot methods like listdir and __truediv__.
+_join = os.path.join
+_normpath = os.path.normpath
+_abspath = os.path.abspath
+_realpath = os.path.realpath
+_split = os.path.split
+_splitdrive = os.path.splitdrive
+_dirname = os.path.dirname
+_basename = os.path.basename
+_normcase = os.path.normcase
+_expanduser = os.path.expanduser
+_expandvars = os.path.expandvars
+_exists = os.path.exists
+_getsize = os.path.getsize
+_ismount = os.path.ismount
+_isabs = os.path.isabs
+_S_ISDIR = statmod.S_ISDIR
+_S_ISREG = statmod.S_ISREG
+_S_ISLNK = statmod.S_ISLNK
+
+# Invariant: WinPath.path (and the underlying str value) is always a non-empty,
+# normalized path. Operations whose output provably preserves that invariant —
+# dirname/basename/split of a normalized path, os.path.abspath/realpath output,
+# scandir entry paths under a normalized base — construct results through
+# WinPath._from_normalized, which does no checking at all. Anything else goes
+# through WinPath() / wp_normpath.
+
+# Matches anything os.path.normpath would rewrite: alternative separators, doubled
+# separators, '.'/'..' components, and trailing separators. Paths that don't match
+# are already normalized and can skip the normpath call entirely.
+_needs_norm_parts = [
+    rf"{re.escape(os.sep)}{{2,}}",
+    rf"(?:^|{re.escape(os.sep)})\.{{1,2}}(?:{re.escape(os.sep)}|$)",
+    rf"{re.escape(os.sep)}$",
+]
+if os.altsep:
+    _needs_norm_parts.insert(0, re.escape(os.altsep))
+_NEEDS_NORM = re.compile("|".join(_needs_norm_parts))
+
+
+def wp_normpath(path: str) -> str:
+    """
+    Normalizes a path string, returning it unchanged when already in normal form.
+
+    Single entry point for the detect-then-normalize dance: one DFA scan over the
+    string, and os.path.normpath only when the scan finds something to rewrite.
+    A compiled accelerator could replace this function wholesale without touching
+    any call site.
+
+    Args:
+        path (str): The path string to normalize.
+
+    Returns:
+        str: The normalized path string.
+    """
+    if not path or _NEEDS_NORM.search(path):
+        return _normpath(path)
+    return path
+
+
+# Bulk case-folding table for ASCII-only paths: lowercases and folds the forward
+# slash to a backslash in one pass, mirroring what ntpath.normcase does char by
+# char. Only used on platforms where normcase actually folds case.
+_ASCII_LOWER = bytes.maketrans(
+    b"ABCDEFGHIJKLMNOPQRSTUVWXYZ/",
+    b"abcdefghijklmnopqrstuvwxyz\\",
+)
+_NORMCASE_FOLDS = _normcase("A/B") != "A/B"
+
+# Negative-lookup cache: paths that exists() has seen missing. Repeated probes of
+# the same missing paths (module search, plugin discovery) become set lookups
+# instead of syscalls. Bounded so it cannot grow without limit; cleared wholesale
+# when full and via WinPath.clear_negative_cache().
+_negative_cache: set[str] = set()
+_NEG_CACHE_MAX = 4096
 
 
-@dataclass
 class WinPath(str):
     """
     Represents a Windows file path.
@@ -44,86 +121,286 @@ class WinPath(str):
 
     Attributes:
         path (str): The normalized path string.
-        sep (str): The path separator. Defaults to the os separator.
-        pardir (str): The parent directory indicator. Defaults to the os default (usually '..').
-        altsep (str): The alternative path separator. Defaults to the os alternative separator.
-        extsep (str): The extension separator. Defaults to '.'.
+        sep (str): Class-level constant for the path separator, taken from the os module.
+        pardir (str): Class-level constant for the parent directory indicator (usually '..').
+        altsep (str): Class-level constant for the alternative path separator.
+        extsep (str): Class-level constant for the extension separator (usually '.').
     """
 
-    path: str
-    sep: str = field(default_factory=lambda: os.sep, init=False, repr=False)
-    pardir: str = field(default_factory=lambda: os.pardir, init=False, repr=False)
-    altsep: str = field(default_factory=lambda: os.altsep, init=False, repr=False)
-    extsep: str = field(default_factory=lambda: os.extsep, init=False, repr=False)
+    __slots__ = ("path", "_abs_path_cache", "_stat_cache", "_lstat_cache", "_repr_cache")
+
+    sep: str = os.sep
+    pardir: str = os.pardir
+    altsep: str = os.altsep
+    extsep: str = os.extsep
+
+    #: Opt-in: intern the entry path strings produced by listdir (when shorter
+    #: than 256 chars). Repeated scans of the same tree then share one .path
+    #: string per entry, so .path comparisons between scans can short-circuit on
+    #: identity; the WinPath objects themselves are still allocated per scan.
+    #: Off by default because interned strings live for the life of the process.
+    intern_prefixes: bool = False
+
+    def __new__(cls, path: str, _normalized: bool = False) -> Self:
+        """
+        Creates a new WinPath object, normalizing the given path.
+
+        Paths that are already in normal form (no redundant or alternative separators
+        and no '.'/'..' components) are used as-is without a normpath call. Internal
+        call sites that produce provably normalized strings pass `_normalized=True`
+        to skip even the check.
+
+        Args:
+            path (str): The path string to wrap.
+            _normalized (bool): Private flag asserting `path` is already normalized.
+
+        Returns:
+            Self: A new WinPath object wrapping the normalized path.
+        """
+        if not _normalized:
+            path = wp_normpath(path)
+        elif not path:
+            path = _normpath(path)
+        obj = str.__new__(cls, path)
+        obj.path = path
+        obj._abs_path_cache = None
+        obj._stat_cache = None
+        obj._lstat_cache = None
+        obj._repr_cache = None
+        return obj
+
+    @classmethod
+    def _from_normalized(cls, path: str) -> Self:
+        """
+        Creates a WinPath from a string that is known to already be normalized.
+
+        Skips all normalization work; callers must guarantee `path` is non-empty
+        and in normal form.
+
+        Args:
+            path (str): An already-normalized, non-empty path string.
+
+        Returns:
+            Self: A new WinPath object wrapping the path as-is.
+        """
+        obj = str.__new__(cls, path)
+        obj.path = path
+        obj._abs_path_cache = None
+        obj._stat_cache = None
+        obj._lstat_cache = None
+        obj._repr_cache = None
+        return obj
+
+    @classmethod
+    def from_iter(cls, paths: Iterable[str], *, normalize: bool = True) -> list[Self]:
+        """
+        Builds a list of WinPath objects from an iterable of path strings.
+
+        Bulk construction does the constructor-method lookup once and skips the
+        per-call fast-path check, so it is noticeably cheaper than calling
+        `WinPath(p)` in a loop. Pass `normalize=False` only when every element is
+        already in normal form.
+
+        Args:
+            paths (Iterable[str]): The path strings to wrap.
+            normalize (bool): Whether to normalize each path. Defaults to True.
+
+        Returns:
+            list[Self]: A list of WinPath objects, in input order.
+        """
+        _make = cls._from_normalized
+        if normalize:
+            _np = wp_normpath
+            return [_make(_np(p)) for p in paths]
+        return [_make(p or ".") for p in paths]
+
+    @property
+    def _abs_path(self) -> str:
+        """
+        Returns the normalized absolute form of the path, computing it on first access.
+
+        Computing the absolute path requires a `getcwd` syscall, so it is deferred until
+        a property that actually needs it (`parent`, `is_dir`, etc.) is accessed.
+
+        Returns:
+            str: The normalized absolute path string.
+        """
+        abs_path = self._abs_path_cache
+        if abs_path is None:
+            abs_path = _normpath(_abspath(self.path))
+            self._abs_path_cache = abs_path
+        return abs_path
+
+    def _stat_cached(self) -> os.stat_result | bool:
+        """
+        Returns a cached stat result for the path, issuing at most one syscall.
+
+        A path that does not exist is cached as `False` so repeated `is_*` checks
+        do not re-stat. Use `invalidate()` to clear the cache after the filesystem
+        has been mutated, or `stat()` for an uncached result.
+
+        Returns:
+            os.stat_result | bool: The stat result, or False if the path does not exist.
+        """
+        result = self._stat_cache
+        if result is None:
+            cached = self._lstat_cache
+            if cached is not None and cached is not False and not _S_ISLNK(cached.st_mode):
+                result = cached
+            else:
+                try:
+                    result = os.stat(self._abs_path)
+                except OSError:
+                    result = False
+            self._stat_cache = result
+        return result
 
-    def __post_init__(self) -> None:
+    def _lstat_cached(self) -> os.stat_result | bool:
         """
-        Post-initialization method that normalizes the path and sets the absolute path.
+        Returns a cached lstat result for the path, issuing at most one syscall.
 
-        This method is automatically called after the object is initialized.
+        Like `_stat_cached`, but does not follow a final symbolic link; a missing
+        path is cached as `False`.
+
+        Returns:
+            os.stat_result | bool: The lstat result, or False if the path does not exist.
+        """
+        result = self._lstat_cache
+        if result is None:
+            try:
+                result = os.lstat(self._abs_path)
+            except OSError:
+                result = False
+            self._lstat_cache = result
+        return result
+
+    def invalidate(self) -> None:
+        """
+        Clears the cached stat and absolute-path results for this object.
+
+        Call this after creating, removing, or renaming the underlying file (or
+        after changing the working directory) so the `is_*` properties reflect
+        the current state of the filesystem.
 
         Returns:
             None
         """
-        self.__abs_path: str = os.path.normpath(os.path.abspath(self.path))
-        self.path = os.path.normpath(self)
+        self._abs_path_cache = None
+        self._stat_cache = None
+        self._lstat_cache = None
 
     def __truediv__(self, other: Self | str) -> Self:
         """
         Concatenates the current WinPath object with another path or string.
 
+        Since `self.path` is already normalized, the join result only needs a
+        normpath pass when `other` introduces something to rewrite, so chained
+        joins like `p / "a" / "b"` are syscall-free.
+
         Args:
             other (WinPath or str): The path or string to be concatenated.
 
         Returns:
             WinPath: A new WinPath object representing the concatenated path.
         """
-        return WinPath(os.path.join(self.path, other))
+        joined = _join(self.path, other if isinstance(other, str) else str(other))
+        return WinPath._from_normalized(wp_normpath(joined))
 
-    def __str__(self) -> str:
+    def __rtruediv__(self, other: Self | str) -> Self:
         """
-        Returns a string representation of the WinPath object.
+        Concatenates another path or string with the current WinPath object.
+
+        Args:
+            other (WinPath or str): The path or string to prepend.
+
+        Returns:
+            WinPath: A new WinPath object representing the concatenated path.
         """
-        return self.path
+        joined = _join(other if isinstance(other, str) else str(other), self.path)
+        return WinPath._from_normalized(wp_normpath(joined))
 
     def __repr__(self) -> str:
         """
-        Returns a printable representation of the WinPath object.
+        Returns a printable representation of the WinPath object, cached after the
+        first call since the path is immutable.
         """
-        return f"WinPath({self.path})"
+        result = self._repr_cache
+        if result is None:
+            result = f"WinPath({self.path})"
+            self._repr_cache = result
+        return result
 
     def exists(self) -> bool:
         """
         Check if the path exists.
 
+        Paths seen missing are remembered in a module-level negative cache, so
+        repeatedly probing the same missing path costs a set lookup rather than
+        a syscall. Call `clear_negative_cache()` after creating files that were
+        previously probed.
+
         Returns:
             bool: True if the path exists, False otherwise.
         """
-        return os.path.exists(self.path)
+        path = self.path
+        if path in _negative_cache:
+            return False
+        found = _exists(path)
+        if not found:
+            if len(_negative_cache) >= _NEG_CACHE_MAX:
+                _negative_cache.clear()
+            _negative_cache.add(path)
+        return found
 
-    def split_path(self: Self) -> tuple[Self, ...]:
+    @classmethod
+    def clear_negative_cache(cls) -> None:
         """
-        Splits the path into a tuple of WinPath objects.
+        Clears the negative-lookup cache used by `exists()`.
+
+        Call this after creating, renaming, or mounting anything that may have
+        been probed while missing.
 
         Returns:
-            tuple[Self, ...]: A tuple of WinPath objects representing the split path.
+            None
         """
-        segments: tuple[Self, ...] = tuple(
-            WinPath(ea) for ea in os.path.split(self.path)
-        )
-        return segments
+        _negative_cache.clear()
 
-    def split_drive(self: Self) -> tuple[Self, ...]:
+    def split_path(self: Self, as_wp: bool = False) -> tuple[str, ...]:
+        """
+        Splits the path into a (head, tail) tuple.
+
+        Plain strings are returned by default, since most callers unpack the pieces
+        immediately and wrapping them in WinPath objects is wasted work; pass
+        `as_wp=True` to get WinPath objects instead.
+
+        Args:
+            as_wp (bool): Whether to wrap the pieces in WinPath objects.
+
+        Returns:
+            tuple[str, ...]: The head and tail of the path.
+        """
+        if as_wp:
+            head, tail = _split(self.path)
+            return WinPath._from_normalized(head or "."), WinPath._from_normalized(tail or ".")
+        return _split(self.path)
+
+    def split_drive(self: Self, as_wp: bool = False) -> tuple[str, ...]:
         """
         Splits the drive from the path.
 
+        Plain strings are returned by default; pass `as_wp=True` to get WinPath
+        objects instead.
+
+        Args:
+            as_wp (bool): Whether to wrap the pieces in WinPath objects.
+
         Returns:
-            tuple[Self, ...]: A tuple containing the drive and the rest of the path.
+            tuple[str, ...]: The drive and the rest of the path.
         """
-        segments: tuple[Self, ...] = tuple(
-            WinPath(ea) for ea in os.path.splitdrive(self.path)
-        )
-        return segments
+        if as_wp:
+            drive, rest = _splitdrive(self.path)
+            return WinPath._from_normalized(drive or "."), WinPath._from_normalized(rest or ".")
+        return _splitdrive(self.path)
 
     def split_ext(self: Self) -> tuple[Self, str, str]:
         """
@@ -133,12 +410,11 @@ class WinPath(str):
             tuple[Self, str, str]: A tuple where the first element is the path without the
             extension, the second is the base name of the file, and the third is the extension.
         """
-        _head, _base = self.split_path()
-        return (
-            (_head, *os.path.splitext(_base))
-            if self.extsep in _base
-            else (self, "", "")
-        )
+        _head, _base = _split(self.path)
+        dot = _base.rfind(self.extsep)
+        if dot <= 0:
+            return (WinPath._from_normalized(_head or "."), _base, "")
+        return (WinPath._from_normalized(_head or "."), _base[:dot], _base[dot:])
 
     def expand_user(self: Self) -> Self:
         """
@@ -147,7 +423,7 @@ class WinPath(str):
         Returns:
             Self: A new WinPath object with the expanded path.
         """
-        return WinPath(os.path.expanduser(self.path))
+        return WinPath(_expanduser(self.path))
 
     def expand_vars(self: Self) -> Self:
         """
@@ -156,16 +432,26 @@ class WinPath(str):
         Returns:
             Self: A new WinPath object with the expanded path.
         """
-        return WinPath(os.path.expandvars(self.path))
+        return WinPath(_expandvars(self.path))
 
     def norm_case(self: Self) -> Self:
         """
         Normalizes the case of the path.
 
+        ASCII-only paths take a bulk translate fast path instead of the char-by-char
+        normcase loop; on platforms where normcase is the identity the path is
+        returned unchanged.
+
         Returns:
-            Self: A new WinPath object with the normalized path.
+            Self: A WinPath object with the normalized path.
         """
-        return WinPath(os.path.normcase(self.path))
+        if not _NORMCASE_FOLDS:
+            return self
+        path = self.path
+        if path.isascii():
+            folded = path.encode("latin-1").translate(_ASCII_LOWER).decode("latin-1")
+            return WinPath._from_normalized(folded)
+        return WinPath(_normcase(path))
 
     def basename(self: Self) -> Self:
         """
@@ -175,7 +461,7 @@ class WinPath(str):
         Returns:
             Self: A new WinPath object with the base name of the path.
         """
-        return WinPath(os.path.basename(self.path))
+        return WinPath._from_normalized(_basename(self.path) or ".")
 
     def dirname(self: Self) -> Self:
         """
@@ -185,7 +471,7 @@ class WinPath(str):
         Returns:
             Self: A new WinPath object with the directory name of the path.
         """
-        return WinPath(os.path.dirname(self.path))
+        return WinPath._from_normalized(_dirname(self.path) or ".")
 
     def abspath(self: Self) -> Self:
         """
@@ -194,7 +480,7 @@ class WinPath(str):
         Returns:
             Self: A new WinPath object with the absolute path.
         """
-        return WinPath(os.path.abspath(self.path))
+        return WinPath._from_normalized(_abspath(self.path))
 
     def realpath(self: Self) -> Self:
         """
@@ -204,7 +490,7 @@ class WinPath(str):
         Returns:
             Self: A new WinPath object with the real path.
         """
-        return WinPath(os.path.realpath(self.path))
+        return WinPath._from_normalized(_realpath(self.path))
 
     def getsize(self: Self) -> int:
         """
@@ -213,7 +499,7 @@ class WinPath(str):
         Returns:
             int: The size of the path in bytes.
         """
-        return os.path.getsize(self.path)
+        return _getsize(self.path)
 
     def stat(self: Self) -> os.stat_result:
         """
@@ -234,19 +520,44 @@ class WinPath(str):
         Returns:
             Self: A new WinPath object with the joined path.
         """
-        return WinPath(os.path.join(self.path, *paths))
+        return WinPath(_join(self.path, *paths))
 
     def listdir(self: Self) -> list[Self]:
         """
         Returns a list containing the names of the entries in the directory given by path.
 
+        Entries are built through the `_from_normalized` fast constructor, and each
+        one caches the lstat result reported by `os.scandir`, so later `is_dir`/
+        `is_file`/`is_symlink` checks on the children do not re-stat.
+
         Returns:
             list[Self]: A list of WinPath objects representing the entries in the directory.
         """
-        return [
-            WinPath(self / ea)
-            for ea in os.listdir(self.path if self.is_dir else self.parent.path)
-        ]
+        base = self.path
+        try:
+            it = os.scandir(base)
+        except NotADirectoryError:
+            base = self.parent.path
+            it = os.scandir(base)
+        # scandir under a '.' base yields './name' entry paths, which are not in
+        # normal form; the bare entry name is.
+        dot_base = base == "."
+        intern = sys.intern if self.intern_prefixes else None
+        entries: list[Self] = []
+        with it:
+            for entry in it:
+                child_path = entry.name if dot_base else entry.path
+                if intern is not None and len(child_path) < 256:
+                    child_path = intern(child_path)
+                child = WinPath._from_normalized(child_path)
+                if _isabs(child_path):
+                    child._abs_path_cache = child_path
+                try:
+                    child._lstat_cache = entry.stat(follow_symlinks=False)
+                except OSError:
+                    pass
+                entries.append(child)
+        return entries
 
     def ls(self: Self) -> list[Self]:
         """
@@ -260,12 +571,25 @@ class WinPath(str):
     @property
     def parent(self: Self) -> Self:
         """
-        Returns the parent directory of the current path.
+        Returns the lexical parent directory of the current path.
+
+        This is computed from the path as given, without resolving it against the
+        current working directory; use `abs_parent` for the resolved form.
 
         Returns:
             Self: A new WinPath object representing the parent directory.
         """
-        return WinPath(os.path.dirname(self.__abs_path))
+        return WinPath._from_normalized(_dirname(self.path) or ".")
+
+    @property
+    def abs_parent(self: Self) -> Self:
+        """
+        Returns the parent directory of the absolute form of the current path.
+
+        Returns:
+            Self: A new WinPath object representing the resolved parent directory.
+        """
+        return WinPath._from_normalized(_dirname(self._abs_path) or ".")
 
     @property
     def ext(self: Self) -> str:
@@ -275,7 +599,9 @@ class WinPath(str):
         Returns:
             str: The file extension of the current path.
         """
-        return self.split_ext()[-1]
+        _base = _basename(self.path)
+        dot = _base.rfind(self.extsep)
+        return _base[dot:] if dot > 0 else ""
 
     @property
     def base(self: Self) -> Self:
@@ -295,7 +621,8 @@ class WinPath(str):
         Returns:
             bool: True if the path is a directory, False otherwise.
         """
-        return os.path.isdir(self.__abs_path)
+        result = self._stat_cached()
+        return result is not False and _S_ISDIR(result.st_mode)
 
     @property
     def is_file(self) -> bool:
@@ -305,7 +632,8 @@ class WinPath(str):
         Returns:
             bool: True if the path is a regular file, False otherwise.
         """
-        return os.path.isfile(self.__abs_path)
+        result = self._stat_cached()
+        return result is not False and _S_ISREG(result.st_mode)
 
     @property
     def is_symlink(self) -> bool:
@@ -315,7 +643,8 @@ class WinPath(str):
         Returns:
             bool: True if the path is a symbolic link, False otherwise.
         """
-        return os.path.islink(self.__abs_path)
+        result = self._lstat_cached()
+        return result is not False and _S_ISLNK(result.st_mode)
 
     @property
     def is_mount(self) -> bool:
@@ -325,7 +654,7 @@ class WinPath(str):
         Returns:
             bool: True if the path is a mount point, False otherwise.
         """
-        return os.path.ismount(self.__abs_path)
+        return _ismount(self._abs_path)
 
     @property
     def is_absolute(self) -> bool:
@@ -335,7 +664,7 @@ class WinPath(str):
         Returns:
             bool: True if the path is an absolute pathname, False otherwise.
         """
-        return os.path.isabs(self.path)
+        return _isabs(self.path)
 
     @property
     def is_relative(self) -> bool:
@@ -345,4 +674,4 @@ class WinPath(str):
         Returns:
             bool: True if the path is a relative pathname, False otherwise.
         """
-        return not os.path.isabs(self.path)
+        return not _isabs(self.path)